@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+import utils as U
+
+FEATURIZERS_MULTI = [U.featurize_desafios_vec, U.featurize_valores_vec, U.featurize_no_ves_vec, U.featurize_need_vec]
+
+
+def test_multi_sin_textos_da_dummies_en_cero():
+    for s in [pd.Series([np.nan, 3.0]), pd.Series([np.nan, np.nan])]:
+        for f in FEATURIZERS_MULTI:
+            out = f(s)
+            assert out.shape[0] == len(s)
+            assert out.to_numpy().sum() == 0
+
+
+def test_multi_mezcla_de_tipos_como_escalar():
+    s = pd.Series([np.nan, 3.0, "Pasión, Liderazgo"], dtype=object)
+    out = U.featurize_valores_vec(s)
+    esperado = pd.DataFrame([U.featurize_valores(v) for v in s], index=s.index)
+    assert (out.to_numpy() == esperado.to_numpy()).all()
@@ -1,5 +1,6 @@
 import re
 import unicodedata
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 
@@ -8,6 +9,22 @@ import pandas as pd
 # Normalización de texto
 # ==========================
 
+# Tras pasar a ascii y lowercase, cualquier racha de no-letras (incluye espacios)
+# se vuelve un solo espacio: quita signos y colapsa espacios en una pasada
+_RE_NO_ALFA = re.compile(r"[^a-z]+")
+_RE_ESPACIOS = re.compile(r"\s+")
+
+
+def _a_ascii(x) -> str:
+    """`str(x)` sin acentos; si ya es ascii se salta la ida y vuelta NFKD/codec."""
+    x = str(x)
+    if x.isascii():
+        return x
+    return unicodedata.normalize("NFKD", x).encode("ascii", "ignore").decode("ascii")
+
+
+# Las respuestas se repiten mucho: cada texto distinto se normaliza una sola vez
+@lru_cache(maxsize=4096, typed=True)
 def normalize_key_strict(x: str) -> str:
     """
     a) strip espacios (extremos)
@@ -21,23 +38,123 @@ def normalize_key_strict(x: str) -> str:
     Returns:
         str: La cadena normalizada
     """
-    x = str(x).strip()
-    x = unicodedata.normalize("NFKD", x).encode("ascii", "ignore").decode("ascii")
-    x = re.sub(r"[^a-zA-Z ]+", " ", x)
-    x = re.sub(r"\s+", " ", x).strip().lower()
-    return x
+    x = _a_ascii(x).lower()
+    return _RE_NO_ALFA.sub(" ", x).strip()
 
 
+@lru_cache(maxsize=4096, typed=True)
 def normalize_key_soft(x: str) -> str:
     """
     Versión más suave usada en celdas posteriores del notebook:
     - Normaliza acentos
     - Solo colapsa espacios y lowercase (mantiene números y signos)
     """
-    x = str(x)
-    x = unicodedata.normalize("NFKD", x).encode("ascii", "ignore").decode("ascii")
-    x = re.sub(r"\s+", " ", x).strip().lower()
-    return x
+    x = _a_ascii(x).lower()
+    return " ".join(x.split())
+
+
+def _ascii_series(s: pd.Series) -> pd.Series:
+    """`str` + NFKD + descarta lo no-ascii, sobre toda la columna."""
+    return s.astype(str).str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+
+
+def _por_unicos(s: pd.Series, f) -> pd.Series:
+    """
+    Aplica `f` (Series -> Series) solo a los K valores distintos no nulos de `s`
+    y reexpande con los códigos de `pd.factorize`; NaN se conserva.
+    """
+    codes, uniques = pd.factorize(s)
+    res = f(pd.Series(np.asarray(uniques, dtype=object))).to_numpy(dtype=object)
+    return pd.Series(np.append(res, np.nan)[codes], index=s.index)
+
+
+def _strict_unicos(u: pd.Series) -> pd.Series:
+    return _ascii_series(u).str.lower().str.replace(_RE_NO_ALFA, " ", regex=True).str.strip()
+
+
+def _soft_unicos(u: pd.Series) -> pd.Series:
+    return _ascii_series(u).str.lower().str.replace(_RE_ESPACIOS, " ", regex=True).str.strip()
+
+
+def normalize_series_strict(s: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de `normalize_key_strict` sobre una columna completa.
+    Solo se normalizan los valores distintos. Los NaN se conservan como NaN.
+    """
+    return _por_unicos(s, _strict_unicos)
+
+
+def normalize_series_soft(s: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de `normalize_key_soft` sobre una columna completa.
+    Solo se normalizan los valores distintos. Los NaN se conservan como NaN.
+    """
+    return _por_unicos(s, _soft_unicos)
+
+
+def _compila_alias(alias2col: dict) -> re.Pattern:
+    """
+    Compila todos los alias de una categoría en una sola alternancia (más largos
+    primero). El lookahead permite coincidencias traslapadas, igual que `alias in t`.
+    """
+    # En una misma posición solo se reporta un alias: si uno es prefijo de otro,
+    # ambos deben ir a la misma columna para no perder coincidencias
+    for a in alias2col:
+        for b in alias2col:
+            if a != b and b.startswith(a) and alias2col[a] != alias2col[b]:
+                raise ValueError(f"El alias {a!r} es prefijo de {b!r} pero mapea a otra columna")
+    alias = sorted(alias2col, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(re.escape(a) for a in alias) + "))")
+
+
+def _dummies_por_alias(t: pd.Series, patron: re.Pattern, alias2col: dict, cols: list) -> np.ndarray:
+    """
+    Escanea cada texto normalizado una sola vez con `patron` y marca la columna
+    destino de cada alias encontrado. Devuelve una matriz bool (filas x `cols`).
+    """
+    hits = pd.Series(t.str.findall(patron).to_numpy()).explode().map(alias2col).dropna()
+    idx = pd.Index(cols).get_indexer(hits)
+    out = np.zeros((len(t), len(cols)), dtype=bool)
+    out[hits.index[idx >= 0], idx[idx >= 0]] = True
+    return out
+
+
+def _contiene_alguna(t: pd.Series, frases: list) -> np.ndarray:
+    """`True` si el texto contiene alguna de las frases (una sola alternancia)."""
+    patron = "|".join(re.escape(f) for f in frases)
+    return t.str.contains(patron, regex=True, na=False).to_numpy()
+
+
+# ==========================
+# Mapas y dummies sobre categorías
+# ==========================
+
+def map_categorias(s: pd.Series, mapping: dict, dtype=None) -> pd.Series:
+    """
+    Equivalente a `s.map(mapping)` para mapas ordinales (valores numéricos): la columna
+    se codifica con las llaves del mapa como categorías y el resultado sale de una LUT
+    de numpy con sus valores, indexada con los códigos. Sin `dtype` se infiere como
+    `.map` (int64 si todos los valores son enteros y no hay faltantes; si no, float64).
+    """
+    codes = pd.Categorical(s, categories=list(mapping)).codes
+    # Última posición para el código -1 (NaN o etiqueta fuera del mapa)
+    lut = np.array(list(mapping.values()) + [np.nan], dtype="float64")
+    vals = lut[codes]
+    if dtype is None:
+        enteros = all(isinstance(v, (int, np.integer)) for v in mapping.values())
+        dtype = "int64" if enteros and not np.isnan(vals).any() else "float64"
+    return pd.Series(vals, index=s.index).astype(dtype)
+
+
+def dummies_categoria(s: pd.Series, prefix: str) -> pd.DataFrame:
+    """
+    Dummies `{prefix}_{categoria}` de una columna categórica indexando una
+    identidad con `cat.codes` (como `pd.get_dummies`, NaN queda en 0).
+    """
+    cats = s.cat.categories
+    # Identidad con una fila extra de ceros: el código -1 (NaN) cae en esa fila
+    tabla = np.eye(len(cats) + 1, len(cats), dtype=np.uint8)
+    return pd.DataFrame(tabla[s.cat.codes.to_numpy()], index=s.index, columns=[f"{prefix}_{c}" for c in cats])
 
 
 # ==========================
@@ -79,33 +196,37 @@ def homogeneizar_pais(x: str) -> str:
     return MAP_PAISES.get(key, str(x).strip())
 
 
+def _pais_unicos(u: pd.Series) -> pd.Series:
+    return _strict_unicos(u).map(MAP_PAISES).fillna(u.astype(str).str.strip())
+
+
+def homogeneizar_pais_vec(s: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de `homogeneizar_pais`: normaliza y busca en MAP_PAISES solo
+    los valores distintos; lo que no está en el mapa queda con `strip`. NaN se conserva.
+    """
+    return _por_unicos(s, _pais_unicos)
+
+
 # ==========================
 # Edad y género
 # ==========================
 
+EDAD_ORDEN = ["Menor de 18", "18-24", "25-34", "35-44", "45-54", "55+"]
+EDAD_MIDPOINT = [16.5, 21.0, 30.0, 40.0, 50.0, 60.0]
+
+
 def transforma_edad(df: pd.DataFrame, age_col: str) -> pd.DataFrame:
     """
     Transforma la columna de edad en una columna ordinal y una columna de punto medio.
     """
     out = df.copy()
-    age_label_to_ordinal = {
-        "Menor de 18": 0,
-        "18-24": 1,
-        "25-34": 2,
-        "35-44": 3,
-        "45-54": 4,
-        "55+": 5,
-    }
-    age_label_to_midpoint = {
-        "Menor de 18": 16.5,
-        "18-24": 21.0,
-        "25-34": 30.0,
-        "35-44": 40.0,
-        "45-54": 50.0,
-        "55+": 60.0,
-    }
-    out["edad_ordinal"] = out[age_col].map(age_label_to_ordinal).astype("Int64")
-    out["edad_midpoint"] = out[age_col].map(age_label_to_midpoint).astype("float64")
+    # Un solo paso de codificación; el código -1 (NaN o etiqueta desconocida) cae
+    # en la última posición de la LUT de puntos medios
+    codes = pd.Categorical(out[age_col], categories=EDAD_ORDEN, ordered=True).codes
+    # Int64 directo de (códigos, máscara), sin pasar por float con NaN
+    out["edad_ordinal"] = pd.arrays.IntegerArray(codes.astype(np.int64), codes < 0)
+    out["edad_midpoint"] = np.array(EDAD_MIDPOINT + [np.nan])[codes]
     return out
 
 
@@ -113,17 +234,18 @@ def transforma_genero(df: pd.DataFrame, gender_col: str) -> pd.DataFrame:
     """
     Transforma la columna de género en dummies `genero_*`.
     """
-    out = df.copy()
-    out["genero_categoria"] = pd.Categorical(df[gender_col], ordered=False)
-    dummies_genero = pd.get_dummies(out["genero_categoria"], prefix="genero", dtype="uint8")
-    out = pd.concat([out, dummies_genero], axis=1)
-    return out
+    genero = pd.Series(pd.Categorical(df[gender_col], ordered=False), index=df.index, name="genero_categoria")
+    dummies_genero = dummies_categoria(genero, "genero")
+    # `concat` ya devuelve un frame nuevo: no hace falta copiar `df` antes
+    return pd.concat([df, genero, dummies_genero], axis=1)
+
+
+_RE_SLUG = re.compile(r"[^a-zA-Z0-9]+")
 
 
 def slug(x: str) -> str:
     """Normaliza nombres a snake simple (ascii)."""
-    x = unicodedata.normalize("NFKD", str(x)).encode("ascii", "ignore").decode("ascii")
-    x = re.sub(r"[^a-zA-Z0-9]+", "_", x)
+    x = _RE_SLUG.sub("_", _a_ascii(x))
     return x.strip("_").lower()
 
 
@@ -133,6 +255,8 @@ def slug(x: str) -> str:
 
 REL_COLS = ["fanatico", "atleta_amateur", "atleta_profesional", "trabajo_industria", "no_activo"]
 
+_RE_NO_SIGO = re.compile(r"\bno sigo\b")
+
 
 def ohe_relacion(txt: str) -> pd.Series:
     """
@@ -151,11 +275,24 @@ def ohe_relacion(txt: str) -> pd.Series:
         out["atleta_profesional"] = 1
     if "industria" in t or "trabajo en la industria" in t:
         out["trabajo_industria"] = 1
-    if "no sigo ni trabajo activamente" in t or re.search(r"\bno sigo\b", t):
+    if "no sigo ni trabajo activamente" in t or _RE_NO_SIGO.search(t):
         out["no_activo"] = 1
     return pd.Series(out)
 
 
+def ohe_relacion_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `ohe_relacion` sobre la columna completa."""
+    t = normalize_series_strict(s)
+    return pd.DataFrame({
+        "fanatico": _contiene_alguna(t, ["fanatic"]),
+        "atleta_amateur": _contiene_alguna(t, ["amateur"]),
+        "atleta_profesional": _contiene_alguna(t, ["profesional"]),
+        "trabajo_industria": _contiene_alguna(t, ["industria", "trabajo en la industria"]),
+        # `\bno sigo\b` ya cubre "no sigo ni trabajo activamente"
+        "no_activo": t.str.contains(_RE_NO_SIGO, na=False).to_numpy(),
+    }, index=s.index).astype(np.uint8)
+
+
 FREQ_ORDER = [
     "Nunca",
     "Menos de una vez al mes",
@@ -213,23 +350,43 @@ ALIAS2CANAL = {
 NEGACIONES_CANAL = ["no sigo los juegos en vivo", "no aplica"]
 INDETERMINADO_CANAL = ["donde lo pasen"]
 
+# Alias, negaciones e indeterminados en un solo escaneo; las banderas van al final
+_COLS_CANAL = CANALES + ["no_en_vivo", "indiferente"]
+_ESCANEO_CANAL = {
+    **ALIAS2CANAL,
+    **{f: "no_en_vivo" for f in NEGACIONES_CANAL},
+    **{f: "indiferente" for f in INDETERMINADO_CANAL},
+}
+_PATRON_CANAL = _compila_alias(_ESCANEO_CANAL)
+# Llaves de salida fijas: cada llamada solo llena un arreglo por posición
+_CANAL_KEYS = pd.Index([f"canal__{c}" for c in _COLS_CANAL])
+_CANAL_IDX = {c: i for i, c in enumerate(_COLS_CANAL)}
+
 
 def featurize_canales(txt: str) -> pd.Series:
     """Dummies `canal__*` usando normalización suave."""
-    out = {f"canal__{c}": 0 for c in CANALES}
-    flags = {"canal__no_en_vivo": 0, "canal__indiferente": 0}
+    out = np.zeros(len(_CANAL_KEYS), dtype=np.int64)
     if pd.isna(txt):
-        return pd.Series({**out, **flags})
-    t = normalize_key_soft(txt)
-    if any(neg in t for neg in NEGACIONES_CANAL):
-        flags["canal__no_en_vivo"] = 1
-        return pd.Series({**out, **flags})
-    if any(ind in t for ind in INDETERMINADO_CANAL):
-        flags["canal__indiferente"] = 1
-    for alias, canal in ALIAS2CANAL.items():
-        if alias in t:
-            out[f"canal__{canal}"] = 1
-    return pd.Series({**out, **flags})
+        return pd.Series(out, index=_CANAL_KEYS)
+    # Un solo escaneo encuentra alias, negaciones e indeterminados
+    hits = {_ESCANEO_CANAL[a] for a in _PATRON_CANAL.findall(normalize_key_soft(txt))}
+    if "no_en_vivo" in hits:
+        out[_CANAL_IDX["no_en_vivo"]] = 1
+        return pd.Series(out, index=_CANAL_KEYS)
+    for canal in hits:
+        out[_CANAL_IDX[canal]] = 1
+    return pd.Series(out, index=_CANAL_KEYS)
+
+
+def featurize_canales_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_canales` sobre la columna completa."""
+    t = normalize_series_soft(s)
+    hits = _dummies_por_alias(t, _PATRON_CANAL, _ESCANEO_CANAL, _COLS_CANAL)
+    neg = hits[:, -2].copy()
+    # Una negación anula todo lo demás
+    hits &= ~neg[:, None]
+    hits[:, -2] = neg
+    return pd.DataFrame(hits.astype(np.uint8), index=s.index, columns=_CANAL_KEYS)
 
 
 # ==========================
@@ -250,24 +407,37 @@ ALIAS2RED = {
 
 NEGACIONES_RED = ["no lo sigo en redes sociales", "no aplica"]
 
+# Alias y banderas en un solo escaneo; las banderas van al final
+_COLS_RED = REDES + ["no_redes", "no_aplica"]
+_ESCANEO_RED = {**ALIAS2RED, "no lo sigo en redes sociales": "no_redes", "no aplica": "no_aplica"}
+_PATRON_RED = _compila_alias(_ESCANEO_RED)
+_RED_KEYS = pd.Index([f"rs__{c}" for c in _COLS_RED])
+_RED_IDX = {c: i for i, c in enumerate(_COLS_RED)}
+
 
 def featurize_redes(txt: str) -> pd.Series:
     """Dummies `rs__*` usando normalización suave."""
-    out = {f"rs__{r}": 0 for r in REDES}
-    flags = {"rs__no_redes": 0, "rs__no_aplica": 0}
+    out = np.zeros(len(_RED_KEYS), dtype=np.int64)
     if pd.isna(txt):
-        return pd.Series({**out, **flags})
-    t = normalize_key_soft(txt)
-    if "no aplica" in t:
-        flags["rs__no_aplica"] = 1
-        return pd.Series({**out, **flags})
-    if "no lo sigo en redes sociales" in t:
-        flags["rs__no_redes"] = 1
-        return pd.Series({**out, **flags})
-    for alias, red in ALIAS2RED.items():
-        if alias in t:
-            out[f"rs__{red}"] = 1
-    return pd.Series({**out, **flags})
+        return pd.Series(out, index=_RED_KEYS)
+    hits = {_ESCANEO_RED[a] for a in _PATRON_RED.findall(normalize_key_soft(txt))}
+    for flag in ("no_aplica", "no_redes"):
+        if flag in hits:
+            out[_RED_IDX[flag]] = 1
+            return pd.Series(out, index=_RED_KEYS)
+    for red in hits:
+        out[_RED_IDX[red]] = 1
+    return pd.Series(out, index=_RED_KEYS)
+
+
+def featurize_redes_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_redes` sobre la columna completa."""
+    t = normalize_series_soft(s)
+    hits = _dummies_por_alias(t, _PATRON_RED, _ESCANEO_RED, _COLS_RED)
+    # "no aplica" tiene prioridad sobre "no lo sigo", y cualquiera anula las redes
+    hits[:, -2] &= ~hits[:, -1]
+    hits[:, :-2] &= ~(hits[:, -2] | hits[:, -1])[:, None]
+    return pd.DataFrame(hits.astype(np.uint8), index=s.index, columns=_RED_KEYS)
 
 
 # ==========================
@@ -317,25 +487,38 @@ ALIAS2TIPO = {
 
 NEGACIONES_TIPO = ["no aplica"]
 
+# Alias y negación en un solo escaneo; la bandera va al final
+_COLS_TIPO = TIPOS + ["no_aplica"]
+_ESCANEO_TIPO = {**ALIAS2TIPO, **{f: "no_aplica" for f in NEGACIONES_TIPO}}
+_PATRON_TIPO = _compila_alias(_ESCANEO_TIPO)
+_TIPO_KEYS = pd.Index([f"cont__{c}" for c in _COLS_TIPO])
+_TIPO_IDX = {c: i for i, c in enumerate(TIPOS)}
+
 
 def featurize_tipos(txt: str) -> pd.Series:
     """Dummies `cont__*` usando normalización suave."""
-    out = {f"cont__{t}": 0 for t in TIPOS}
-    flags = {"cont__no_aplica": 0}
+    out = np.zeros(len(_TIPO_KEYS), dtype=np.int64)
     if pd.isna(txt):
-        return pd.Series({**out, **flags})
-    t = normalize_key_soft(txt)
-    if any(neg in t for neg in NEGACIONES_TIPO):
-        flags["cont__no_aplica"] = 1
-        return pd.Series({**out, **flags})
-    for alias, tipo in ALIAS2TIPO.items():
-        if alias in t:
-            # Nota: el notebook mapea estas dos alias a "contenido_creado_por_usuarios",
-            # que no está en TIPOS. Respetamos esa lógica (no se creará columna si no existe en TIPOS).
-            key = f"cont__{tipo}"
-            if key in out:
-                out[key] = 1
-    return pd.Series({**out, **flags})
+        return pd.Series(out, index=_TIPO_KEYS)
+    hits = {_ESCANEO_TIPO[a] for a in _PATRON_TIPO.findall(normalize_key_soft(txt))}
+    if "no_aplica" in hits:
+        out[-1] = 1
+        return pd.Series(out, index=_TIPO_KEYS)
+    for tipo in hits:
+        # Nota: el notebook mapea estas dos alias a "contenido_creado_por_usuarios",
+        # que no está en TIPOS. Respetamos esa lógica (no se creará columna si no existe en TIPOS).
+        j = _TIPO_IDX.get(tipo)
+        if j is not None:
+            out[j] = 1
+    return pd.Series(out, index=_TIPO_KEYS)
+
+
+def featurize_tipos_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_tipos` sobre la columna completa."""
+    t = normalize_series_soft(s)
+    hits = _dummies_por_alias(t, _PATRON_TIPO, _ESCANEO_TIPO, _COLS_TIPO)
+    hits[:, :-1] &= ~hits[:, -1:]
+    return pd.DataFrame(hits.astype(np.uint8), index=s.index, columns=_TIPO_KEYS)
 
 
 # ==========================
@@ -358,27 +541,53 @@ def featurize_sigue(txt: str) -> pd.Series:
     return pd.Series({"sigue_equipos": np.nan, "sigue_jugadoras": np.nan})
 
 
+def featurize_sigue_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_sigue`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [
+        _contiene_alguna(t, ["ambos"]),
+        _contiene_alguna(t, ["equipos"]),
+        _contiene_alguna(t, ["jugadoras"]),
+        _contiene_alguna(t, ["no aplica"]) | (t == "no").to_numpy(),
+    ]
+    return pd.DataFrame({
+        "sigue_equipos": np.select(conds, [1, 1, 0, 0], default=np.nan),
+        "sigue_jugadoras": np.select(conds, [1, 0, 1, 0], default=np.nan),
+    }, index=s.index)
+
+
 # ==========================
 # Asistencia a partidos
 # ==========================
 
+# Reglas en orden (la primera que aplica gana): frases, asist_ord, ha_asistido
+_REGLAS_ASISTENCIA = [
+    (["con frecuencia"], 2, 1),
+    (["una o dos"], 1, 1),
+    (["no aplica"], np.nan, 0),
+    (["no"], 0, 0),
+]
+
+
 def featurize_asistencia(txt: str) -> pd.Series:
     """Devuelve `asist_ord` y `ha_asistido` (usa normalización suave)."""
     if pd.isna(txt):
         return pd.Series({"asist_ord": np.nan, "ha_asistido": np.nan})
     t = normalize_key_soft(txt)
-    if "con frecuencia" in t:
-        k = 2
-    elif "una o dos" in t or "una o dos veces" in t:
-        k = 1
-    elif "no aplica" in t:
-        return pd.Series({"asist_ord": np.nan, "ha_asistido": 0})
-    elif "no" in t:
-        k = 0
-    else:
-        k = np.nan
-    ha = (k in (1, 2)) * 1 if not pd.isna(k) else np.nan
-    return pd.Series({"asist_ord": k, "ha_asistido": ha})
+    for frases, k, ha in _REGLAS_ASISTENCIA:
+        if any(f in t for f in frases):
+            return pd.Series({"asist_ord": k, "ha_asistido": ha})
+    return pd.Series({"asist_ord": np.nan, "ha_asistido": np.nan})
+
+
+def featurize_asistencia_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_asistencia`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [_contiene_alguna(t, frases) for frases, _, _ in _REGLAS_ASISTENCIA]
+    return pd.DataFrame({
+        "asist_ord": np.select(conds, [k for _, k, _ in _REGLAS_ASISTENCIA], default=np.nan),
+        "ha_asistido": np.select(conds, [ha for _, _, ha in _REGLAS_ASISTENCIA], default=np.nan),
+    }, index=s.index)
 
 
 # ==========================
@@ -422,17 +631,34 @@ def map_compra(x: str) -> int:
 # Inversión igual que masculino
 # ==========================
 
+INVERSION_ORD2CAT = {1: "si", 0: "no", -1: "no_seguro"}
+
+
 def map_inversion(x: str) -> pd.Series:
     if pd.isna(x):
         return pd.Series({"inversion_igual_ord": np.nan, "inversion_igual_cat": np.nan})
     t = normalize_key_soft(x)
     if t.startswith("si"):
-        return pd.Series({"inversion_igual_ord": 1, "inversion_igual_cat": "si"})
-    if t == "no":
-        return pd.Series({"inversion_igual_ord": 0, "inversion_igual_cat": "no"})
-    if "no estoy seguro" in t:
-        return pd.Series({"inversion_igual_ord": -11, "inversion_igual_cat": "no_seguro"})
-    return pd.Series({"inversion_igual_ord": np.nan, "inversion_igual_cat": np.nan})
+        k = 1
+    elif t == "no":
+        k = 0
+    elif "no estoy seguro" in t:
+        k = -1
+    else:
+        return pd.Series({"inversion_igual_ord": np.nan, "inversion_igual_cat": np.nan})
+    return pd.Series({"inversion_igual_ord": k, "inversion_igual_cat": INVERSION_ORD2CAT[k]})
+
+
+def map_inversion_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `map_inversion`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [
+        t.str.startswith("si", na=False).to_numpy(),
+        (t == "no").to_numpy(),
+        _contiene_alguna(t, ["no estoy seguro"]),
+    ]
+    ord_ = pd.Series(np.select(conds, [1, 0, -1], default=np.nan), index=s.index)
+    return pd.DataFrame({"inversion_igual_ord": ord_, "inversion_igual_cat": ord_.map(INVERSION_ORD2CAT)})
 
 
 # ==========================
@@ -452,6 +678,21 @@ def map_actitud(x: str) -> pd.Series:
     return pd.Series({"actitud_marca_ff_ord": np.nan, "actitud_marca_ff_cat": np.nan})
 
 
+ACTITUD_ORD2CAT = {-1: "boicot", 0: "no_cambia", 1: "apoyo"}
+
+
+def map_actitud_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `map_actitud`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [
+        _contiene_alguna(t, ["boicot"]),
+        _contiene_alguna(t, ["no cambiaria", "no cambia"]),
+        _contiene_alguna(t, ["apoyar", "apoyaria"]),
+    ]
+    ord_ = pd.Series(np.select(conds, [-1, 0, 1], default=np.nan), index=s.index)
+    return pd.DataFrame({"actitud_marca_ff_ord": ord_, "actitud_marca_ff_cat": ord_.map(ACTITUD_ORD2CAT)})
+
+
 # ==========================
 # Sentimiento campañas con deportistas
 # ==========================
@@ -471,6 +712,18 @@ def map_sentimiento(x: str):
     return np.nan
 
 
+def map_sentimiento_vec(s: pd.Series) -> pd.Series:
+    """Versión vectorizada de `map_sentimiento`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [
+        _contiene_alguna(t, ["forzado", "superficial"]),
+        _contiene_alguna(t, ["no lo noto"]),
+        _contiene_alguna(t, ["inspira"]),
+        _contiene_alguna(t, ["me gusta", "confianza"]),
+    ]
+    return pd.Series(np.select(conds, [-1, 0, 2, 1], default=np.nan), index=s.index)
+
+
 # ==========================
 # Crecimiento a 5 años
 # ==========================
@@ -490,6 +743,21 @@ def map_crecimiento(x: str) -> pd.Series:
     return pd.Series({"crecimiento_5y_ord": np.nan, "crecimiento_5y_no_seguro": 0})
 
 
+def map_crecimiento_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `map_crecimiento`: mismas reglas, en orden, como máscaras."""
+    t = normalize_series_soft(s)
+    conds = [
+        _contiene_alguna(t, ["se mantendra igual"]),
+        _contiene_alguna(t, ["crecera lentamente"]),
+        _contiene_alguna(t, ["crecera significativamente"]),
+        _contiene_alguna(t, ["no estoy seguro"]),
+    ]
+    return pd.DataFrame({
+        "crecimiento_5y_ord": np.select(conds, [0, 1, 2, np.nan], default=np.nan),
+        "crecimiento_5y_no_seguro": np.select(conds, [0, 0, 0, 1], default=0).astype("uint8"),
+    }, index=s.index)
+
+
 # ==========================
 # Desafíos (multi)
 # ==========================
@@ -525,12 +793,57 @@ def _split_multi(s: str) -> set:
     return {p.strip() for p in s.split(",")} if isinstance(s, str) else set()
 
 
+def _indice_tokens(mapa: dict, prefijo: str = "") -> tuple:
+    """
+    Índice inverso de un mapa `{columna: frase o [frases]}`, armado una sola vez al
+    importar: nombres de columna, las opciones como `pd.Index` y una tabla uint8
+    opción -> columnas destino (la última fila, en ceros, es para opciones fuera del mapa).
+    """
+    cols = [f"{prefijo}{k}" for k in mapa]
+    frase2cols = {}
+    for j, frases in enumerate(mapa.values()):
+        for f in ([frases] if isinstance(frases, str) else frases):
+            frase2cols.setdefault(f, []).append(j)
+    tabla = np.zeros((len(frase2cols) + 1, len(cols)), dtype=np.uint8)
+    for i, js in enumerate(frase2cols.values()):
+        tabla[i, js] = 1
+    return cols, pd.Index(list(frase2cols)), tabla
+
+
+def _conjuntos_tokens(mapa: dict, prefijo: str = "") -> list:
+    """Pares (columna, frozenset de opciones) de un mapa, para las versiones escalares."""
+    return [(f"{prefijo}{k}", frozenset([v] if isinstance(v, str) else v)) for k, v in mapa.items()]
+
+
+def _dummies_por_tokens(s: pd.Series, indice: tuple) -> pd.DataFrame:
+    """
+    Versión vectorizada de `_split_multi` + pertenencia. Los valores distintos se
+    parten en comas una sola vez (formato largo valor -> opción) y cada opción se
+    busca en el índice de `_indice_tokens`; un solo scan arma todo el bloque.
+    """
+    cols, frases, tabla = indice
+    codes, uniques = pd.factorize(s)
+    # Como `_split_multi`, lo que no es texto no aporta opciones (cae en la fila de ceros)
+    textos = pd.Series([u if isinstance(u, str) else "" for u in uniques], dtype=object)
+    tokens = textos.str.split(",").explode().str.strip()
+    bloque = np.zeros((len(uniques) + 1, len(cols)), dtype=np.uint8)
+    np.bitwise_or.at(bloque, tokens.index.to_numpy(), tabla[frases.get_indexer(tokens)])
+    # Código -1 (NaN) cae en la última fila de `bloque`, que queda en ceros
+    return pd.DataFrame(bloque[codes], index=s.index, columns=cols)
+
+
+_INDICE_DESAFIOS = _indice_tokens(DESAFIOS_MAP)
+_CONJ_DESAFIOS = _conjuntos_tokens(DESAFIOS_MAP)
+
+
 def featurize_desafios(s: str) -> pd.Series:
     opts = _split_multi(s)
-    out = {}
-    for col_name, frases in DESAFIOS_MAP.items():
-        out[col_name] = 1 if any(frase in opts for frase in frases) else 0
-    return pd.Series(out)
+    return pd.Series({col: int(not opts.isdisjoint(frases)) for col, frases in _CONJ_DESAFIOS})
+
+
+def featurize_desafios_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_desafios` sobre la columna completa."""
+    return _dummies_por_tokens(s, _INDICE_DESAFIOS)
 
 
 # ==========================
@@ -557,15 +870,18 @@ VAL_TOKENS = {
 }
 
 
+_INDICE_VAL = _indice_tokens(VAL_TOKENS, prefijo="valor__")
+_CONJ_VAL = _conjuntos_tokens(VAL_TOKENS, prefijo="valor__")
+
+
 def featurize_valores(s: str) -> pd.Series:
     opts = _split_multi(s)
-    out = {}
-    for k, etiquetas in VAL_TOKENS.items():
-        if isinstance(etiquetas, str):
-            out[f"valor__{k}"] = 1 if etiquetas in opts else 0
-        else:
-            out[f"valor__{k}"] = 1 if any(e in opts for e in etiquetas) else 0
-    return pd.Series(out)
+    return pd.Series({col: int(not opts.isdisjoint(frases)) for col, frases in _CONJ_VAL})
+
+
+def featurize_valores_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_valores` sobre la columna completa."""
+    return _dummies_por_tokens(s, _INDICE_VAL)
 
 
 # ==========================
@@ -587,12 +903,18 @@ NO_VES_TOKENS = {
 }
 
 
+_INDICE_NO_VES = _indice_tokens(NO_VES_TOKENS, prefijo="no_ves__")
+_CONJ_NO_VES = _conjuntos_tokens(NO_VES_TOKENS, prefijo="no_ves__")
+
+
 def featurize_no_ves(s: str) -> pd.Series:
     opts = _split_multi(s)
-    out = {}
-    for k, frases in NO_VES_TOKENS.items():
-        out[f"no_ves__{k}"] = int(any(frase in opts for frase in frases))
-    return pd.Series(out)
+    return pd.Series({col: int(not opts.isdisjoint(frases)) for col, frases in _CONJ_NO_VES})
+
+
+def featurize_no_ves_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_no_ves` sobre la columna completa."""
+    return _dummies_por_tokens(s, _INDICE_NO_VES)
 
 
 # ==========================
@@ -612,12 +934,18 @@ NEED_TOKENS = {
 }
 
 
+_INDICE_NEED = _indice_tokens(NEED_TOKENS, prefijo="need__")
+_CONJ_NEED = _conjuntos_tokens(NEED_TOKENS, prefijo="need__")
+
+
 def featurize_need(s: str) -> pd.Series:
     opts = _split_multi(s)
-    out = {}
-    for k, frases in NEED_TOKENS.items():
-        out[f"need__{k}"] = int(any(frase in opts for frase in frases))
-    return pd.Series(out)
+    return pd.Series({col: int(not opts.isdisjoint(frases)) for col, frases in _CONJ_NEED})
+
+
+def featurize_need_vec(s: pd.Series) -> pd.DataFrame:
+    """Versión vectorizada de `featurize_need` sobre la columna completa."""
+    return _dummies_por_tokens(s, _INDICE_NEED)
 
 
 # ==========================
@@ -647,12 +975,15 @@ PERC_MAP = {
 }
 
 
+CONOCE_LIGA_MAP = {
+    "Sí": 1,
+    "No": -1,
+    "Tal vez": 0,
+}
+
+
 def flag_conoce_liga(v: str) -> float:
-    if v == "Sí":
-        return 1
-    if v == "No":
-        return -1
-    if v == "Tal vez":
-        return 0
-    return np.nan
+    if pd.isna(v):
+        return np.nan
+    return CONOCE_LIGA_MAP.get(v, np.nan)
 